@@ -2,10 +2,71 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
 
+if TYPE_CHECKING:  # pragma: no cover - NumPy is only needed for batches
+    import numpy as np
+    from numpy.typing import ArrayLike
 
-@dataclass(frozen=True)
+_BMI_EDGES = (18.5, 25.0, 30.0)
+_BMI_CATEGORIES = ("Underweight", "Normal weight", "Overweight", "Obesity")
+
+# Below this size NumPy's vectorised path is already fast enough that the
+# Numba kernel's thread start-up is not worth it.
+_NUMBA_MIN_BATCH = 100_000
+
+
+@lru_cache(maxsize=None)
+def _get_kernel():
+    """Build the Numba BMI kernel on first use, or return ``None`` without Numba."""
+    try:
+        from numba import njit, prange
+    except ImportError:  # pragma: no cover - Numba is an optional accelerator
+        return None
+
+    # No fastmath: it permits reciprocal approximations that break bit-for-bit
+    # agreement with calculate_bmi. Rounding happens afterwards in _round_bmi.
+    @njit(parallel=True, cache=True)
+    def _bmi_kernel(weights, heights, out_bmi, out_category):
+        """Compute raw BMI and category index for each pair in a single fused loop."""
+        for i in prange(weights.shape[0]):
+            value = weights[i] / (heights[i] * heights[i])
+            out_bmi[i] = value
+            if value < 18.5:
+                out_category[i] = 0
+            elif value < 25.0:
+                out_category[i] = 1
+            elif value < 30.0:
+                out_category[i] = 2
+            else:
+                out_category[i] = 3
+
+    return _bmi_kernel
+
+
+def _round_bmi(bmi: "np.ndarray") -> "np.ndarray":
+    """Round BMI values to one decimal exactly like the built-in :func:`round`.
+
+    ``np.round`` scales by ten and rounds half to even, which disagrees with
+    ``round`` for values sitting next to a ``.x5`` tie (``10.65`` becomes
+    ``10.6`` instead of ``10.7``). Only those near-ties are re-rounded in Python.
+    """
+    import numpy as np
+
+    # np.array() keeps 0-d input writable; np.round would return a scalar.
+    bmi = np.asarray(bmi)
+    scaled = bmi * 10
+    rounded = np.array(np.round(bmi, 1))
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) <= 2 * np.spacing(np.abs(scaled))
+    if near_tie.any():
+        rounded[near_tie] = [round(value, 1) for value in bmi[near_tie].tolist()]
+    return rounded[()]
+
+
+@dataclass(frozen=True, slots=True)
 class BMIResult:
     bmi: float
     category: str
@@ -13,22 +74,53 @@ class BMIResult:
 
 def calculate_bmi(weight_kg: float, height_m: float) -> BMIResult:
     """Calculate BMI and return the numeric value and classification."""
-    if height_m <= 0:
-        raise ValueError("height must be greater than zero")
-    if weight_kg <= 0:
-        raise ValueError("weight must be greater than zero")
+    if not (height_m > 0 and weight_kg > 0):
+        raise ValueError(
+            f"weight and height must be greater than zero, got {weight_kg!r}, {height_m!r}"
+        )
 
-    bmi = weight_kg / (height_m ** 2)
+    bmi = weight_kg / (height_m * height_m)
     category = classify_bmi(bmi)
     return BMIResult(bmi=round(bmi, 1), category=category)
 
 
+def calculate_bmi_batch(
+    weights_kg: "ArrayLike", heights_m: "ArrayLike"
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Calculate BMI for arrays of weights and heights using NumPy.
+
+    Returns a ``(bmi, categories)`` pair of arrays, rounded and classified the
+    same way as :func:`calculate_bmi`. Requires NumPy; large one-dimensional
+    batches use a parallel Numba kernel when Numba is installed.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - NumPy is only needed for batches
+        raise ImportError("calculate_bmi_batch requires NumPy") from exc
+
+    weights = np.asarray(weights_kg, dtype=float)
+    heights = np.asarray(heights_m, dtype=float)
+    if not ((heights > 0).all() and (weights > 0).all()):
+        raise ValueError(
+            f"weight and height must be greater than zero, got {weights!r}, {heights!r}"
+        )
+
+    if (
+        weights.ndim == 1
+        and weights.shape == heights.shape
+        and weights.size >= _NUMBA_MIN_BATCH
+        and _get_kernel() is not None
+    ):
+        bmi = np.empty_like(weights)
+        category_index = np.empty(weights.shape, dtype=np.int8)
+        _get_kernel()(weights, heights, bmi, category_index)
+        return _round_bmi(bmi), np.asarray(_BMI_CATEGORIES)[category_index]
+
+    bmi = weights / np.square(heights)
+    categories = np.asarray(_BMI_CATEGORIES)[np.searchsorted(_BMI_EDGES, bmi, side="right")]
+    return _round_bmi(bmi), categories
+
+
 def classify_bmi(bmi: float) -> str:
     """Classify BMI into WHO categories."""
-    if bmi < 18.5:
-        return "Underweight"
-    if bmi < 25:
-        return "Normal weight"
-    if bmi < 30:
-        return "Overweight"
-    return "Obesity"
+    return _BMI_CATEGORIES[bisect_right(_BMI_EDGES, bmi)]
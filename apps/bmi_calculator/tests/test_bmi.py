@@ -1,4 +1,6 @@
+import copy
 import math
+import pickle
 
 import pytest
 
@@ -26,3 +28,59 @@ def test_calculate_bmi_invalid_inputs():
         bmi.calculate_bmi(-60, 1.8)
     with pytest.raises(ValueError):
         bmi.calculate_bmi(60, 0)
+
+
+def test_bmi_result_copy_and_pickle():
+    result = bmi.calculate_bmi(68, 1.75)
+    assert copy.copy(result) == result
+    assert copy.deepcopy(result) == result
+    assert pickle.loads(pickle.dumps(result)) == result
+
+
+def test_calculate_bmi_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    # 42.6 kg / 2.0 m and friends land next to a .x5 tie, where np.round
+    # and the built-in round disagree.
+    weights = np.array([45, 68, 74, 80, 120, 42.6, 112.6, 51.8, 84.2])
+    heights = np.array([1.7, 1.75, 2.0, 1.7, 1.7, 2.0, 2.0, 2.0, 2.0])
+
+    values, categories = bmi.calculate_bmi_batch(weights, heights)
+
+    for weight, height, value, category in zip(weights.tolist(), heights.tolist(), values, categories):
+        expected = bmi.calculate_bmi(weight, height)
+        assert value == expected.bmi
+        assert category == expected.category
+
+
+@pytest.mark.parametrize("weight, height", [(42.6, 2.0), (70, 1.75)])
+def test_calculate_bmi_batch_scalar_inputs(weight, height):
+    pytest.importorskip("numpy")
+    value, category = bmi.calculate_bmi_batch(weight, height)
+
+    expected = bmi.calculate_bmi(weight, height)
+    assert value == expected.bmi
+    assert category == expected.category
+
+
+def test_calculate_bmi_batch_invalid_inputs():
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError, match="weight and height must be greater than zero"):
+        bmi.calculate_bmi_batch([60, -1], [1.8, 1.8])
+    with pytest.raises(ValueError, match="weight and height must be greater than zero"):
+        bmi.calculate_bmi_batch([60, 70], [1.8, 0])
+
+
+def test_calculate_bmi_batch_numba_kernel_matches_scalar(monkeypatch):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    weights = np.round(rng.uniform(40, 150, 1000), 1)
+    heights = np.round(rng.uniform(1.4, 2.1, 1000), 2)
+
+    monkeypatch.setattr(bmi, "_NUMBA_MIN_BATCH", 0)
+    fast_values, fast_categories = bmi.calculate_bmi_batch(weights, heights)
+
+    for weight, height, value, category in zip(weights.tolist(), heights.tolist(), fast_values, fast_categories):
+        expected = bmi.calculate_bmi(weight, height)
+        assert value == expected.bmi
+        assert category == expected.category
@@ -1,5 +1,5 @@
 """Morse code translation utilities."""
 
-from .morse_translator import decode_from_morse, encode_to_morse
+from .morse_translator import decode_from_morse, encode_many, encode_to_morse
 
-__all__ = ["encode_to_morse", "decode_from_morse"]
+__all__ = ["encode_to_morse", "encode_many", "decode_from_morse"]
@@ -3,7 +3,7 @@ import sys
 
 import pytest
 
-from apps.morse_code_translator import decode_from_morse, encode_to_morse
+from apps.morse_code_translator import decode_from_morse, encode_many, encode_to_morse
 
 
 @pytest.mark.parametrize(
@@ -18,10 +18,30 @@ def test_encode_to_morse(text, expected):
     assert encode_to_morse(text) == expected
 
 
+def test_encode_to_morse_custom_separators():
+    assert encode_to_morse("sos  help", letter_sep="|", word_sep="/") == "...|---|.../....|.|.-..|.--."
+
+
+def test_encode_many_matches_encode_to_morse():
+    texts = ["SOS", "Hello World", "", "2024"]
+    assert encode_many(texts) == [encode_to_morse(text) for text in texts]
+    assert encode_many(["ab c"], letter_sep="|", word_sep="/") == [".-|-.../-.-."]
+
+
 def test_decode_from_morse():
     assert decode_from_morse(".... . .-.. .-.. ---") == "HELLO"
 
 
+def test_decode_from_morse_custom_separators():
+    assert decode_from_morse(" ...|---|... / ....|.. /", letter_sep="|", word_sep="/") == "SOS HI"
+
+
+
+def test_decode_from_morse_strips_surrounding_whitespace_per_word():
+    assert decode_from_morse(". / -\n") == "E T"
+    assert decode_from_morse("...|---|...\t/\t....|..", letter_sep="|", word_sep="/") == "SOS HI"
+
+
 @pytest.mark.parametrize(
     "text",
     ["Community Toolbox", "Python 3.11", "Test-driven development!"],
@@ -38,6 +58,25 @@ def test_decode_invalid_sequence():
         decode_from_morse(".-.-.-.-")
 
 
+@pytest.mark.parametrize("morse", ["/", ".-/-", ". / / -"])
+def test_decode_rejects_malformed_word_separator(morse):
+    with pytest.raises(ValueError):
+        decode_from_morse(morse)
+
+
+def test_encode_unsupported_character():
+    with pytest.raises(ValueError, match="'#'"):
+        encode_to_morse("abc#")
+
+
+@pytest.mark.parametrize("text", ["ß", "\ufb01"])
+def test_encode_rejects_characters_that_uppercase_to_several(text):
+    with pytest.raises(ValueError, match=repr(text)):
+        encode_to_morse(text)
+    with pytest.raises(ValueError, match=repr(text)):
+        encode_many(["ok", text])
+
+
 def test_cli_encode(tmp_path):
     script = "from apps.morse_code_translator.morse_translator import main; print(main(['--text', 'abc']).translated)"
     result = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True, text=True)
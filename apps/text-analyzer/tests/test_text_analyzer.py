@@ -3,13 +3,14 @@ Tests for the Text Analyzer module.
 """
 
 import pytest
+import re
 import sys
 import os
 
 # Add the parent directory to the path so we can import the module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from text_analyzer import TextAnalyzer, TextStats
+from text_analyzer import TextAnalyzer, TextStats, analyze
 
 
 class TestTextAnalyzer:
@@ -85,6 +86,14 @@ class TestTextAnalyzer:
         expected = ["hello", "world", "how", "are", "you"]
         assert words == expected
 
+    def test_get_words_ascii_matches_regex(self):
+        """Test that the ASCII fast path tokenizes like the regex path."""
+        text = "It's e.g. foo_bar, 3.14!\tTabs\nand-dashes"
+        words = self.analyzer._get_words(text)
+
+        assert words == re.findall(r'\b\w+\b', text.lower())
+        assert words == self.analyzer._get_words(text + " é")[:-1]
+
     def test_count_sentences(self):
         """Test sentence counting."""
         text = "First sentence. Second sentence! Third sentence?"
@@ -145,6 +154,11 @@ class TestTextAnalyzer:
         # Should return at most 10 words (default limit)
         assert len(stats.most_common_words) <= 10
 
+    def test_module_level_analyze(self):
+        """Test the module-level analyze helper matches the class method."""
+        text = "The quick brown fox. The lazy dog!"
+        assert analyze(text) == self.analyzer.analyze(text)
+
 
 class TestTextStats:
     """Test cases for TextStats dataclass."""
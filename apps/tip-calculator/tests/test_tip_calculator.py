@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import copy
 import math
 import os
+import pickle
 import sys
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 import pytest
 
@@ -46,6 +48,14 @@ def test_calculate_tip_round_up_adjusts_total():
     assert math.isclose(float(breakdown.tip_amount), 9.61, abs_tol=0.01)
 
 
+def test_tip_breakdown_copy_and_pickle():
+    breakdown = calculate_tip(80, 18, num_people=4)
+
+    assert copy.copy(breakdown) == breakdown
+    assert copy.deepcopy(breakdown) == breakdown
+    assert pickle.loads(pickle.dumps(breakdown)) == breakdown
+
+
 @pytest.mark.parametrize(
     "bill, tip, people, expected_message",
     [
@@ -61,6 +71,17 @@ def test_calculate_tip_invalid_inputs(bill, tip, people, expected_message):
     assert expected_message in str(excinfo.value)
 
 
+def test_calculate_tip_rejects_bool_amount():
+    with pytest.raises(InvalidOperation):
+        calculate_tip(True, 20)
+
+
+def test_calculate_tip_rejects_amounts_beyond_decimal_precision():
+    # Quantizing the totals surfaces overflow instead of silently losing cents.
+    with pytest.raises(InvalidOperation):
+        calculate_tip(10**25, 966, 7, round_up=True)
+
+
 def test_format_breakdown_output_custom_currency():
     breakdown = calculate_tip(45.5, 22, num_people=2)
     output = format_breakdown(breakdown, currency_symbol="€")
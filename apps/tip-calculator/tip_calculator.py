@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_CEILING, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Mapping, Sequence
 
 
 CENTS = Decimal("0.01")
+_HUNDRED = Decimal(100)
 DEFAULT_TIP_PERCENT = Decimal("20")
 
 __all__ = [
@@ -25,6 +27,10 @@ def _to_decimal(value: float | int | str | Decimal) -> Decimal:
 
     if isinstance(value, Decimal):
         return value
+    if type(value) is int:
+        # Integers convert exactly without a round-trip through str(); bool is
+        # excluded so True/False are still rejected by Decimal(str(value)).
+        return Decimal(value)
     return Decimal(str(value))
 
 
@@ -34,7 +40,7 @@ def _quantize_currency(value: Decimal, rounding: str = ROUND_HALF_UP) -> Decimal
     return value.quantize(CENTS, rounding=rounding)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TipBreakdown:
     """Represents calculated tip information using precise decimal values."""
 
@@ -94,17 +100,18 @@ def calculate_tip(
 
     bill = _quantize_currency(bill)
     tip_pct = _quantize_currency(tip_pct)
-    tip_amount = _quantize_currency(bill * tip_pct / Decimal("100"))
+    tip_amount = _quantize_currency(bill * tip_pct / _HUNDRED)
     total_amount = _quantize_currency(bill + tip_amount)
 
+    people = Decimal(num_people)
     if round_up:
         amount_per_person = _quantize_currency(
-            total_amount / Decimal(num_people), rounding=ROUND_CEILING
+            total_amount / people, rounding=ROUND_CEILING
         )
         total_amount = _quantize_currency(amount_per_person * num_people)
         tip_amount = _quantize_currency(total_amount - bill)
     else:
-        amount_per_person = _quantize_currency(total_amount / Decimal(num_people))
+        amount_per_person = _quantize_currency(total_amount / people)
 
     return TipBreakdown(
         bill_amount=bill,
@@ -133,18 +140,20 @@ def format_breakdown(
         A human-readable, multi-line string suitable for CLI output.
     """
 
-    default_lines: Sequence[str] = (
-        f"Bill Amount: {currency_symbol}{breakdown.bill_amount:.2f}",
-        f"Tip Percentage: {breakdown.tip_percent:.2f}%",
-        f"Number of People: {breakdown.num_people}",
-        f"Tip Amount: {currency_symbol}{breakdown.tip_amount:.2f}",
-        f"Total Amount: {currency_symbol}{breakdown.total_amount:.2f}",
-        f"Amount Per Person: {currency_symbol}{breakdown.amount_per_person:.2f}",
+    if lines:
+        return "\n".join(lines)
+
+    # Adjacent f-strings compile to a single string build, so the default
+    # layout is formatted without intermediate line objects.
+    return (
+        f"Bill Amount: {currency_symbol}{breakdown.bill_amount:.2f}\n"
+        f"Tip Percentage: {breakdown.tip_percent:.2f}%\n"
+        f"Number of People: {breakdown.num_people}\n"
+        f"Tip Amount: {currency_symbol}{breakdown.tip_amount:.2f}\n"
+        f"Total Amount: {currency_symbol}{breakdown.total_amount:.2f}\n"
+        f"Amount Per Person: {currency_symbol}{breakdown.amount_per_person:.2f}"
     )
 
-    output_lines = lines or default_lines
-    return "\n".join(output_lines)
-
 
 def calculate_tip_from_cli(args: Mapping[str, str]) -> TipBreakdown:
     """Helper to calculate tips from CLI-style key-value arguments."""
@@ -157,8 +166,9 @@ def calculate_tip_from_cli(args: Mapping[str, str]) -> TipBreakdown:
     return calculate_tip(bill_amount, tip_percent, num_people, round_up=round_up)
 
 
-def parse_arguments(argv: Sequence[str] | None = None):
-    """Parse command-line arguments and return an ``argparse`` namespace."""
+@lru_cache(maxsize=None)
+def _build_parser():
+    """Build the CLI argument parser once and reuse it for later calls."""
 
     import argparse
 
@@ -187,7 +197,13 @@ def parse_arguments(argv: Sequence[str] | None = None):
         help="Currency symbol to use when displaying amounts (default: $)",
     )
 
-    return parser.parse_args(argv)
+    return parser
+
+
+def parse_arguments(argv: Sequence[str] | None = None):
+    """Parse command-line arguments and return an ``argparse`` namespace."""
+
+    return _build_parser().parse_args(argv)
 
 
 def main(argv: Sequence[str] | None = None) -> int: